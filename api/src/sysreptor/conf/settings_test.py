@@ -34,6 +34,11 @@ REST_FRAMEWORK |= {
 }
 
 
+# Fast password hashing: secure hashers are slow by design and provide no value in tests
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
 ALLOWED_HOSTS = ['*']
 CSRF_TRUSTED_ORIGINS = ['http://*', 'https://*']
 MFA_FIDO2_RP_ID = ''
@@ -6,6 +6,8 @@ from django.utils import timezone
 
 from sysreptor.utils.history import HistoricalRecords
 
+USER_CONDITION_FIELDS = ['is_superuser', 'is_project_admin', 'is_designer', 'is_template_editor', 'is_user_manager']
+
 
 class NotificationSpecQuerySet(models.QuerySet):
     def only_active(self):
@@ -24,12 +26,32 @@ class NotificationSpecManagerBase(models.Manager.from_queryset(NotificationSpecQ
 
         # User conditions
         users = PentestUser.objects.all()
-        for role in ['is_superuser', 'is_project_admin', 'is_designer', 'is_template_editor', 'is_user_manager']:
+        for role in USER_CONDITION_FIELDS:
             if role in notification.user_conditions and isinstance(notification.user_conditions[role], bool):
                 users = users.filter(**{role: notification.user_conditions[role]})
 
         return users
 
+    def users_for_notificationspecs(self, notifications) -> dict:
+        """
+        Match users for multiple notification specs at once.
+        Users are fetched with a single query and user_conditions are evaluated in memory,
+        instead of running one query per notification spec.
+        Returns a dict mapping notification spec IDs to lists of users.
+        """
+        from sysreptor.users.models import PentestUser
+
+        users = list(PentestUser.objects.only('id', *USER_CONDITION_FIELDS))
+        today = timezone.now().date()
+        out = {}
+        for notification in notifications:
+            if notification.active_until and notification.active_until < today:
+                out[notification.id] = []
+                continue
+            conditions = {k: v for k, v in notification.user_conditions.items() if k in USER_CONDITION_FIELDS and isinstance(v, bool)}
+            out[notification.id] = [u for u in users if all(getattr(u, k) == v for k, v in conditions.items())]
+        return out
+
     def notificationspecs_for_user(self, user):
         return self \
             .only_active() \
@@ -41,8 +63,21 @@ class NotificationSpecManagerBase(models.Manager.from_queryset(NotificationSpecQ
 
     def bulk_create(self, *args, **kwargs):
         objs = super().bulk_create(*args, **kwargs)
+        if not objs:
+            return objs
+
         for o in objs:
+            # Users are assigned below for all notification specs at once instead of in the post_create signal
+            o.skip_post_create_signal = True
             signals.post_save.send(sender=o.__class__, instance=o, created=True, raw=False, update_fields=None)
+
+        # Create UserNotifications of all notification specs in a single bulk insert
+        from sysreptor.notifications.models import UserNotification
+        users_for_notificationspecs = self.users_for_notificationspecs(objs)
+        UserNotification.objects.bulk_create([
+            n for o in objs
+            for n in UserNotification.objects.build_for_users(users=users_for_notificationspecs[o.id], **self.get_usernotification_kwargs(o))
+        ], batch_size=1000)
         return objs
 
 
@@ -59,17 +94,19 @@ class RemoteNotificationSpecManager(NotificationSpecManagerBase):
             ) for n in specs
         ])
 
+    def get_usernotification_kwargs(self, instance, **kwargs):
+        from sysreptor.notifications.models import NotificationType
+        return kwargs | {
+            'visible_until': instance.visible_until,
+            'type': NotificationType.REMOTE,
+            'remotenotificationspec': instance,
+        }
+
     def assign_to_users(self, instance):
-        from sysreptor.notifications.models import NotificationType, UserNotification
+        from sysreptor.notifications.models import UserNotification
         users = self.users_for_notificationspec(instance) \
             .exclude(notifications__remotenotificationspec=instance)
-
-        return UserNotification.objects.create_for_users(
-            users=users,
-            visible_until=instance.visible_until,
-            type=NotificationType.REMOTE,
-            remotenotificationspec=instance,
-        )
+        return UserNotification.objects.create_for_users(users=users, **self.get_usernotification_kwargs(instance))
 
 
 class CustomNotificationSpecManager(NotificationSpecManagerBase):
@@ -85,17 +122,19 @@ class CustomNotificationSpecManager(NotificationSpecManagerBase):
             ) for n in specs
         ])
 
+    def get_usernotification_kwargs(self, instance, **kwargs):
+        from sysreptor.notifications.models import NotificationType
+        return kwargs | {
+            'visible_until': instance.visible_until,
+            'type': NotificationType.CUSTOM,
+            'customnotificationspec': instance,
+        }
+
     def assign_to_users(self, instance):
-        from sysreptor.notifications.models import NotificationType, UserNotification
+        from sysreptor.notifications.models import UserNotification
         users = self.users_for_notificationspec(instance) \
             .exclude(notifications__customnotificationspec=instance)
-
-        return UserNotification.objects.create_for_users(
-            users=users,
-            visible_until=instance.visible_until,
-            type=NotificationType.CUSTOM,
-            customnotificationspec=instance,
-        )
+        return UserNotification.objects.create_for_users(users=users, **self.get_usernotification_kwargs(instance))
 
 
 class UserNotificationQuerySet(models.QuerySet):
@@ -153,7 +192,10 @@ class UserNotificationManager(models.Manager.from_queryset(UserNotificationQuery
     def create(self, **kwargs):
         return super().create(**self.get_create_kwargs(**kwargs))
 
-    def create_for_users(self, users, skip_for_created_by=False, **kwargs):
+    def build_for_users(self, users, skip_for_created_by=False, **kwargs):
+        """
+        Build unsaved UserNotification instances for the given users
+        """
         from sysreptor.pentests.models import ProjectMemberInfo
 
         if self.get_prevent_notifications():
@@ -169,4 +211,7 @@ class UserNotificationManager(models.Manager.from_queryset(UserNotificationQuery
             if skip_for_created_by and user == created_by:
                 continue
             notifications.append(self.model(**self.get_create_kwargs(user=user, created_by=created_by, **kwargs)))
-        return self.bulk_create(notifications)
+        return notifications
+
+    def create_for_users(self, users, skip_for_created_by=False, **kwargs):
+        return self.bulk_create(self.build_for_users(users=users, skip_for_created_by=skip_for_created_by, **kwargs))
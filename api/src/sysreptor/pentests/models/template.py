@@ -64,6 +64,8 @@ class FindingTemplateTranslation(CustomFieldsMixin, LanguageMixin, BaseModel):
     history = HistoricalRecords()
     objects = models.Manager.from_queryset(querysets.FindingTemplateTranslationQueryset)()
 
+    core_field_names = frozenset(FINDING_FIELDS_CORE.keys())
+
     class Meta:
         constraints = [
             models.UniqueConstraint(fields=['template', 'language'], deferrable=models.Deferrable.DEFERRED, name='unique_language_per_template'),
@@ -79,10 +81,6 @@ class FindingTemplateTranslation(CustomFieldsMixin, LanguageMixin, BaseModel):
     def field_definition(self) -> dict:
         return FindingTemplate.field_definition
 
-    @property
-    def core_field_names(self) -> list[str]:
-        return list(FINDING_FIELDS_CORE.keys())
-
     @property
     def data(self) -> dict:
         return self.get_data()
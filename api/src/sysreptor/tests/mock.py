@@ -107,6 +107,11 @@ def create_user(mfa=False, apitoken=False, public_key=False, notes_kwargs=None,
     return user
 
 
+def create_user_without_notebook(**kwargs) -> PentestUser:
+    # Skip creating notebook pages, images and files for tests that do not need them
+    return create_user(notes_kwargs=[], images_kwargs=[], files_kwargs=[], **kwargs)
+
+
 def create_imported_member(roles=None, **kwargs):
     username = f'user_{get_random_string(8)}'
     return RelatedUserDataExportImportSerializer(instance=ProjectMemberInfo(
@@ -4,16 +4,19 @@ import json
 import random
 import tempfile
 from contextlib import contextmanager
-from uuid import UUID
+from decimal import Decimal
+from uuid import UUID, uuid4
 
 import pytest
 from django.conf import settings
 from django.core import management
 from django.core.files.storage import FileSystemStorage, storages
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import connection
 from django.db.models.fields.files import FieldFile
 from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
 
 from sysreptor.management.commands import encryptdata
 from sysreptor.pentests.models import (
@@ -282,6 +285,33 @@ class TestEncryptedDbField:
         update(self.finding, custom_fields={'test': 'content'}, template_id=self.template.id)
         assert_db_field_encrypted(PentestFinding.objects.filter(id=self.finding.id).values('custom_fields'), False)
 
+    @pytest.mark.parametrize('data', [
+        {'test': 'content', 'nested': {'list': [1, 1.5, None, True, 'text']}},
+        {'datetime': timezone.now(), 'date': timezone.now().date(), 'uuid': uuid4(), 'decimal': Decimal('1.5')},
+        {'int_64bit': 2**63 - 1, 'int_exceeding_64bit': 2**70, 'negative': -2**70},
+        {'nan': float('nan'), 'inf': float('inf'), 'none': None},
+        {1: 'int key', None: 'none key'},
+    ])
+    def test_json_roundtrip(self, data):
+        # Values are stored the same way as by json.dumps with the field's encoder
+        PentestFinding.objects.filter(id=self.finding.id).update(custom_fields=data)
+        assert_db_field_encrypted(PentestFinding.objects.filter(id=self.finding.id).values('custom_fields'), True)
+
+        f = PentestFinding.objects.filter(id=self.finding.id).get()
+        expected = json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+        assert json.dumps(f.custom_fields) == json.dumps(expected)
+
+    def test_json_unsupported_key(self):
+        with pytest.raises(TypeError):
+            PentestFinding.objects.filter(id=self.finding.id).update(custom_fields={uuid4(): 'uuid key'})
+
+    def test_json_legacy_non_json_value(self):
+        enc = io.BytesIO()
+        with crypto.open(fileobj=enc, mode='wb') as c:
+            c.write(b'not json')
+        field = PentestFinding._meta.get_field('custom_fields')
+        assert field.from_db_value(enc.getvalue(), expression=None, connection=connection) == 'not json'
+
 
 @pytest.mark.django_db()
 class TestEncryptDataCommand:
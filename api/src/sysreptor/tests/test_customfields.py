@@ -50,7 +50,11 @@ from sysreptor.utils.fielddefinition.utils import (
     check_definitions_compatible,
     ensure_defined_structure,
 )
-from sysreptor.utils.fielddefinition.validators import FieldDefinitionValidator, FieldValuesValidator
+from sysreptor.utils.fielddefinition.validators import (
+    FieldDefinitionValidator,
+    FieldValuesValidator,
+    JsonSchemaValidator,
+)
 
 
 @pytest.mark.parametrize(('valid', 'definition'), [
@@ -67,6 +71,10 @@ from sysreptor.utils.fielddefinition.validators import FieldDefinitionValidator,
     (False, [{'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}, {'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}]),
     (False, [{'id': 'f', 'type': 'object', 'properties': [{'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}, {'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}]}]),
     (False, [{'id': 'f', 'type': 'list', 'items': {'id': 'f', 'type': 'object', 'properties': [{'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}, {'id': 'f', 'type': 'string', 'label': 'Field 1', 'default': None}]}}]),
+    # Test regex patterns
+    (True, [{'id': 'f', 'type': 'string', 'pattern': '^[0-9a-f]+$'}]),
+    (False, [{'id': 'f', 'type': 'string', 'pattern': '^[0-9a-f+$'}]),
+    (False, [{'id': 'f', 'type': 'list', 'items': {'type': 'object', 'properties': [{'id': 'nested', 'type': 'string', 'pattern': '('}]}}]),
     # Test data types
     (True, [
         {'id': 'field_string', 'type': 'string', 'label': 'String Field', 'default': 'test'},
@@ -109,6 +117,41 @@ def test_definition_formats(valid, definition):
     assert res_valid == valid
 
 
+@pytest.mark.parametrize(('valid', 'definition'), [
+    (True, [{'id': 'f', 'type': 'object', 'properties': [{'id': 'a', 'type': 'string'}]}]),
+    (True, [{'id': 'f', 'type': 'object', 'properties': [{'id': 'a', 'type': 'string'}, {'id': 'b', 'type': 'string'}]}]),
+    (False, [{'id': 'f', 'type': 'object', 'properties': [{'id': 'b', 'type': 'string'}]}]),
+    (False, [{'id': 'f', 'type': 'object', 'properties': [{'id': 'a', 'type': 'number'}]}]),
+    (False, [{'id': 'f', 'type': 'string'}]),
+    (False, []),
+])
+def test_core_field_structure(valid, definition):
+    core_fields = parse_field_definition([{'id': 'f', 'type': 'object', 'properties': [{'id': 'a', 'type': 'string'}]}])
+    res_valid = True
+    try:
+        FieldDefinitionValidator(core_fields=core_fields)(definition)
+    except ValidationError:
+        res_valid = False
+    assert res_valid == valid
+
+
+def test_field_lookup_cache():
+    definition = FieldDefinition(fields=[StringField(id='a'), ObjectField(id='obj', properties=[StringField(id='nested_a')])])
+    assert definition.keys() == ['a', 'obj']
+    assert definition['obj'].keys() == ['nested_a']
+
+    # Reassigning fields invalidates the cache
+    definition.fields = definition.fields + [StringField(id='b')]
+    assert definition.keys() == ['a', 'obj', 'b']
+    del definition['a']
+    assert 'a' not in definition
+    assert definition.keys() == ['obj', 'b']
+    definition['obj'].properties = [StringField(id='nested_b')]
+    assert definition['obj'].keys() == ['nested_b']
+    definition['obj'].fields = [StringField(id='nested_c')]
+    assert definition['obj'].keys() == ['nested_c']
+
+
 @pytest.mark.parametrize(('definition_old', 'definition_new'), [
     (
         {'f': {'type': 'string', 'label': 'String Field', 'origin': 'custom', 'help_text': None, 'default': None, 'required': True, 'spellcheck': True, 'pattern': None}},
@@ -262,6 +305,48 @@ def test_api_serializer_validation(definition, value, expected):
     assert actual is expected
 
 
+@pytest.mark.parametrize(('schema', 'value', 'expected_error'), [
+    ({'type': 'object', 'properties': {'prop': {'type': 'string'}}}, '{"prop": "test"}', None),
+    ({'type': 'object', 'properties': {'prop': {'type': 'string'}}}, '{"prop": 1}', 'Invalid data: does not match JSON schema'),
+    ({'type': 'object', 'properties': {'prop': {'type': 'string'}}}, '["invalid", "schema"]', 'Invalid data: does not match JSON schema'),
+    ({'type': 'object', 'properties': {'prop': {'type': 'string'}}}, 'invalid JSON', 'Invalid data: Not a valid JSON object'),
+    ({'type': 'number'}, 'NaN', None),
+    ({'type': 'integer', 'minimum': 18446744073709551617, 'maximum': 18446744073709551617}, '18446744073709551617', None),
+    ({'type': 'invalid'}, '{}', 'Invalid JSON schema'),
+])
+def test_json_schema_validator(schema, value, expected_error):
+    def get_error(validator_fn, value):
+        try:
+            validator_fn(value)
+            return None
+        except ValidationError as ex:
+            return ex.messages[0]
+
+    validator = JsonSchemaValidator(schema=schema)
+    error_call = get_error(validator, value)
+    error_raw = get_error(validator.validate_raw, value)
+    assert error_raw == error_call
+    if expected_error:
+        assert error_raw.startswith(expected_error)
+    else:
+        assert error_raw is None
+
+    if expected_error != 'Invalid data: Not a valid JSON object':
+        # Parsed values produce the same result
+        value_parsed = json.loads(value)
+        assert get_error(validator.validate_parsed, value_parsed) == error_raw
+        if isinstance(value_parsed, dict):
+            assert get_error(validator, value_parsed) == error_raw
+
+
+def test_json_schema_validator_cache():
+    # Schemas that compare equal in Python (True == 1) use separate cached validators
+    JsonSchemaValidator(schema={'const': 1})('1')
+    JsonSchemaValidator(schema={'const': True})('true')
+    with pytest.raises(ValidationError):
+        JsonSchemaValidator(schema={'const': True})('1')
+
+
 class CustomFieldsTestModel(CustomFieldsMixin):
     def __init__(self, field_definition, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
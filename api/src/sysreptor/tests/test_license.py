@@ -27,6 +27,7 @@ from sysreptor.tests.mock import (
     create_public_key,
     create_template,
     create_user,
+    create_user_without_notebook,
     override_configuration,
     update,
 )
@@ -39,16 +40,21 @@ def assert_api_license_error(res):
     assert res.data['code'] == 'license'
 
 
-def generate_signing_key():
+def generate_signing_key(key_format='raw'):
     private_key = ECC.generate(curve='ed25519')
     public_key = {
         'id': str(uuid4()),
         'algorithm': 'ed25519',
-        'key': b64encode(private_key.public_key().export_key(format='DER')).decode(),
+        'key': b64encode(private_key.public_key().export_key(format=key_format)).decode(),
     }
     return private_key, public_key
 
 
+@pytest.fixture(scope='session')
+def license_signing_key():
+    return generate_signing_key()
+
+
 def sign_license_data(license_data_str: str, public_key: dict, private_key):
     signer = eddsa.new(key=private_key, mode='rfc8032')
     signature = signer.sign(SHA512.new(license_data_str.encode()))
@@ -80,18 +86,21 @@ class TestCommunityLicenseRestrictions:
     @pytest.fixture(autouse=True)
     def setUp(self):
         self.password = get_random_string(length=32)
-        self.user = create_user(is_superuser=True, password=self.password)
-        self.user_regular = create_user(password=self.password)
-        self.user_system = create_user(is_system_user=True, password=self.password)
+        self.user = create_user_without_notebook(is_superuser=True, password=self.password)
+        self.user_regular = create_user_without_notebook(password=self.password)
+        self.user_system = create_user_without_notebook(is_system_user=True)
 
         self.client = api_client(self.user)
-        session = self.client.session
-        session.setdefault('authentication_info', {})['reauth_time'] = timezone.now().isoformat()
-        session.save()
 
         with mock.patch('sysreptor.utils.license.check_license', return_value={'type': license.LicenseType.COMMUNITY, 'users': 2, 'error': None}):
             yield
 
+    def reauthenticate(self):
+        # Only needed for sensitive operations. Not done in setUp, because it creates a DB session.
+        session = self.client.session
+        session.setdefault('authentication_info', {})['reauth_time'] = timezone.now().isoformat()
+        session.save()
+
     def test_spellcheck_disabled(self):
         assert self.client.get(reverse('publicutils-settings')).data['features']['spellcheck'] is False
         assert_api_license_error(self.client.post(reverse('utils-spellcheck')))
@@ -237,6 +246,7 @@ class TestCommunityLicenseRestrictions:
             update(self.user_regular, is_active=True)
 
     def test_apitoken_limit(self):
+        self.reauthenticate()
         res1 = self.client.post(reverse('apitoken-list', kwargs={'pentestuser_pk': 'self'}), data={'name': 'test'})
         assert res1.status_code == 201
         res_token = api_client().get(reverse('pentestuser-detail', kwargs={'pk': 'self'}), HTTP_AUTHORIZATION='Bearer ' + res1.data['token'])
@@ -246,6 +256,7 @@ class TestCommunityLicenseRestrictions:
             APIToken.objects.create(user=self.user)
 
     def test_apitoken_no_expiry(self):
+        self.reauthenticate()
         assert_api_license_error(self.client.post(reverse('apitoken-list', kwargs={'pentestuser_pk': 'self'}), data={'name': 'test', 'expire_date': timezone.now().date().isoformat()}))
 
 
@@ -277,8 +288,8 @@ class TestProfessionalLicenseRestrictions:
 @pytest.mark.django_db()
 class TestLicenseValidation:
     @pytest.fixture(autouse=True)
-    def setUp(self):
-        self.license_private_key, self.license_public_key = generate_signing_key()
+    def setUp(self, license_signing_key):
+        self.license_private_key, self.license_public_key = license_signing_key
         with mock.patch('sysreptor.utils.license.LICENSE_VALIDATION_KEYS', new=[self.license_public_key]):
             yield
 
@@ -342,6 +353,20 @@ class TestLicenseValidation:
         assert license_info['type'] != license.LicenseType.PROFESSIONAL
         assert 'no valid signature' in license_info['error'].lower()
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_license_cache_cleared_on_setting_change(self):
+        with override_settings(LICENSE=self.signed_license(users=10)):
+            assert license.check_license()['users'] == 10
+            with override_settings(LICENSE=self.signed_license(users=20)):
+                assert license.check_license()['users'] == 20
+            assert license.check_license()['users'] == 10
+
+    def test_legacy_der_public_key(self):
+        private_key, public_key = generate_signing_key(key_format='DER')
+        with mock.patch('sysreptor.utils.license.LICENSE_VALIDATION_KEYS', new=[public_key]):
+            license_info = license.decode_and_validate_license(signed_license(keys=[(public_key, private_key)]))
+        assert license_info['type'] == license.LicenseType.PROFESSIONAL
+
     def test_multiple_signatures_only_1_valid(self):
         license_1 = self.signed_license()
         license_content = json.loads(b64decode(license_1))
@@ -358,8 +383,8 @@ class TestLicenseValidation:
 @pytest.mark.django_db()
 class TestLicenseActivationInfo:
     @pytest.fixture(autouse=True)
-    def setUp(self):
-        self.license_private_key, self.license_public_key = generate_signing_key()
+    def setUp(self, license_signing_key):
+        self.license_private_key, self.license_public_key = license_signing_key
         self.license_community = None
         self.license_invalid = 'invalid license string'
         self.license_professional = signed_license(keys=[(self.license_public_key, self.license_private_key)])
@@ -9,6 +9,7 @@ from django.conf import settings
 from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
+from pytest_django.asserts import assertNumQueries
 
 from sysreptor.api_utils.models import BackupLog, BackupLogType
 from sysreptor.notifications.models import (
@@ -20,7 +21,14 @@ from sysreptor.notifications.models import (
 from sysreptor.notifications.tasks import create_notifications, fetch_notifications
 from sysreptor.pentests.import_export.import_export import export_projects, import_projects
 from sysreptor.pentests.models.project import CommentAnswer
-from sysreptor.tests.mock import api_client, create_comment, create_project, create_user, update
+from sysreptor.tests.mock import (
+    api_client,
+    create_comment,
+    create_project,
+    create_user,
+    create_user_without_notebook,
+    update,
+)
 from sysreptor.tests.test_import_export import archive_to_file
 from sysreptor.tests.utils import assertKeysEqual
 from sysreptor.users.models import PentestUser
@@ -48,12 +56,12 @@ def assert_notifications_created_since(expected, since):
 class TestNotificationAssignment:
     @pytest.fixture(autouse=True)
     def setUp(self):
-        self.user_regular = create_user(username='regular')
-        self.user_template_editor = create_user(username='template_editor', is_template_editor=True)
-        self.user_designer = create_user(username='designer', is_designer=True)
-        self.user_user_manager = create_user(username='user_manager', is_user_manager=True)
-        self.user_project_admin = create_user(username='project_admin', is_project_admin=True)
-        self.user_superuser = create_user(username='superuser', is_superuser=True)
+        self.user_regular = create_user_without_notebook(username='regular')
+        self.user_template_editor = create_user_without_notebook(username='template_editor', is_template_editor=True)
+        self.user_designer = create_user_without_notebook(username='designer', is_designer=True)
+        self.user_user_manager = create_user_without_notebook(username='user_manager', is_user_manager=True)
+        self.user_project_admin = create_user_without_notebook(username='project_admin', is_project_admin=True)
+        self.user_superuser = create_user_without_notebook(username='superuser', is_superuser=True)
 
     @pytest.mark.parametrize(('spec', 'expected_users'), [
         (RemoteNotificationSpec(), ['regular', 'template_editor', 'designer', 'user_manager', 'project_admin', 'superuser']),
@@ -78,6 +86,7 @@ class TestNotificationAssignment:
     def test_user_conditions(self, spec, expected_users):
         # Test queryset filter
         assert set(spec.__class__.objects.users_for_notificationspec(spec).values_list('username', flat=True)) == set(expected_users)
+        assert {u.username for u in spec.__class__.objects.users_for_notificationspecs([spec])[spec.id]} == set(expected_users)
 
         # Assigned to correct users
         spec.save()
@@ -87,6 +96,51 @@ class TestNotificationAssignment:
         for u in PentestUser.objects.filter(username__in=expected_users):
             assert spec in spec.__class__.objects.notificationspecs_for_user(u)
 
+    @pytest.mark.parametrize('spec_class', [RemoteNotificationSpec, CustomNotificationSpec])
+    def test_users_for_multiple_specs(self, spec_class):
+        specs = [
+            spec_class(),
+            spec_class(active_until=(timezone.now() - timedelta(days=10)).date()),
+            spec_class(active_until=(timezone.now() + timedelta(days=10)).date(), user_conditions={'is_superuser': True}),
+            spec_class(user_conditions={'is_superuser': False}),
+            spec_class(user_conditions={'is_designer': True, 'is_superuser': False}),
+            spec_class(user_conditions={'is_template_editor': True, 'is_designer': True}),
+            spec_class(user_conditions={'is_user_manager': 'invalid', 'unknown_condition': True}),
+            spec_class(active_until=(timezone.now() - timedelta(days=10)).date(), user_conditions={'is_project_admin': True}),
+        ]
+        with assertNumQueries(1):
+            users_for_specs = spec_class.objects.users_for_notificationspecs(specs)
+        assert users_for_specs.keys() == {s.id for s in specs}
+        for spec in specs:
+            # Same users as matched by the queryset filter
+            assert {u.username for u in users_for_specs[spec.id]} == \
+                   set(spec_class.objects.users_for_notificationspec(spec).values_list('username', flat=True))
+
+    @pytest.mark.parametrize('spec_class', [RemoteNotificationSpec, CustomNotificationSpec])
+    def test_bulk_create(self, spec_class):
+        specs = [
+            spec_class(title='all', text='all'),
+            spec_class(title='superuser', text='superuser', user_conditions={'is_superuser': True}),
+            spec_class(title='designer', text='designer', user_conditions={'is_designer': True}),
+            spec_class(title='expired', text='expired', active_until=(timezone.now() - timedelta(days=10)).date()),
+        ]
+        # Insert notification specs, select users, insert UserNotifications
+        with assertNumQueries(3):
+            spec_class.objects.bulk_create(specs)
+
+        expected_users = {
+            'all': ['regular', 'template_editor', 'designer', 'user_manager', 'project_admin', 'superuser'],
+            'superuser': ['superuser'],
+            'designer': ['designer'],
+            'expired': [],
+        }
+        for spec in specs:
+            assert set(spec.usernotification_set.values_list('user__username', flat=True)) == set(expected_users[spec.title])
+
+    def test_bulk_create_empty(self):
+        with assertNumQueries(0):
+            assert RemoteNotificationSpec.objects.bulk_create([]) == []
+
     @pytest.mark.parametrize(('notification_kwargs', 'expected'), [
         ({'visible_for_days': 10}, (timezone.now() + timedelta(days=10)).date()),
         ({'active_until': (timezone.now() + timedelta(days=10)).date()}, (timezone.now() + timedelta(days=10)).date()),
@@ -1,3 +1,4 @@
+from django.core.signals import setting_changed
 from django.db.models import signals
 from django.dispatch import receiver
 
@@ -60,3 +61,9 @@ def api_token_license_limit(sender, instance, *args, **kwargs):
 
     if instance.expire_date:
         raise license.LicenseError('API token expiration is not supported in Community edition.')
+
+
+@receiver(setting_changed)
+def license_setting_changed(sender, setting, *args, **kwargs):
+    if setting == 'LICENSE':
+        license.clear_license_cache()
@@ -5,12 +5,14 @@ from sysreptor.utils.crypto.fields import EncryptedField
 from sysreptor.utils.fielddefinition.types import FieldDefinition
 from sysreptor.utils.fielddefinition.utils import HandleUndefinedFieldsOptions, ensure_defined_structure
 from sysreptor.utils.fielddefinition.validators import FieldValuesValidator
-from sysreptor.utils.utils import copy_keys, merge, omit_keys
+from sysreptor.utils.utils import merge
 
 
 class CustomFieldsMixin(models.Model):
     custom_fields = models.JSONField(encoder=DjangoJSONEncoder, default=dict, blank=True)
 
+    core_field_names: frozenset[str] = frozenset()
+
     class Meta:
         abstract = True
 
@@ -18,10 +20,6 @@ class CustomFieldsMixin(models.Model):
     def field_definition(self) -> FieldDefinition:
         return None
 
-    @property
-    def core_field_names(self) -> list[str]:
-        return []
-
     @property
     def data(self) -> dict:
         """
@@ -38,9 +36,10 @@ class CustomFieldsMixin(models.Model):
     def get_data(self, include_unknown=False) -> dict:
         # Build dict of all current values
         # Merge core fields stored directly on the model instance and custom_fields stored as dict
-        out = self.custom_fields.copy()
-        for k in self.core_field_names:
-            out[k] = getattr(self, k)
+        # ensure_defined_structure does not modify its input, so custom_fields only needs to be copied when merging core fields
+        out = self.custom_fields
+        if self.core_field_names:
+            out = out | {k: getattr(self, k) for k in self.core_field_names}
 
         # recursively check for undefined fields and set default value
         out = ensure_defined_structure(
@@ -59,9 +58,13 @@ class CustomFieldsMixin(models.Model):
         FieldValuesValidator(self.field_definition)(value)
 
         # Distribute to model fields
-        for k, v in copy_keys(value, self.core_field_names).items():
-            setattr(self, k, v)
-        self.custom_fields = self.custom_fields | omit_keys(value, self.core_field_names)
+        custom_fields = self.custom_fields.copy()
+        for k, v in value.items():
+            if k in self.core_field_names:
+                setattr(self, k, v)
+            else:
+                custom_fields[k] = v
+        self.custom_fields = custom_fields
 
 
 class EncryptedCustomFieldsMixin(CustomFieldsMixin):
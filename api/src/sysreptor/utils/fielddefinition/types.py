@@ -181,10 +181,14 @@ class CweField(BaseStringField):
         """
         return json.loads((Path(__file__).parent / 'cwe.json').read_text())
 
+    @staticmethod
+    @functools.cache
+    def cwe_ids() -> frozenset[str]:
+        return frozenset(f"CWE-{c['id']}" for c in CweField.cwe_definitions())
+
     @staticmethod
     def is_valid_cwe(cwe):
-        return cwe is None or \
-            cwe in set(map(lambda c: f"CWE-{c['id']}", CweField.cwe_definitions()))
+        return cwe is None or cwe in CweField.cwe_ids()
 
     def __post_init__(self):
         if not CweField.is_valid_cwe(self.default):
@@ -231,8 +235,18 @@ class FieldLookupMixin:
         if duplicate_ids:
             raise ValueError(f'Field IDs are not unique. Duplicate IDs: {", ".join(duplicate_ids)}')
 
-    @property
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('fields', 'properties'):
+            # Invalidate cached field_dict
+            self.__dict__.pop('field_dict', None)
+
+    @functools.cached_property
     def field_dict(self):
+        """
+        Fields by ID. Cached until `fields` (or `properties` of ObjectField) is reassigned.
+        Modifying the list in-place (e.g. `fields.append(...)`) does not invalidate the cache: assign a new list instead.
+        """
         return {f.id: f for f in self.fields}
 
     def __contains__(self, field: str|BaseField):
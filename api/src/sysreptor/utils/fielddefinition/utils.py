@@ -88,8 +88,9 @@ def ensure_defined_structure(value, definition: FieldDefinition|BaseField, handl
     """
     if isinstance(definition, FieldDefinition|ObjectField):
         out = value.copy() if include_unknown else {}
+        value = value if isinstance(value, dict) else {}
         for f in definition.fields:
-            out[f.id] = ensure_defined_structure(value=(value if isinstance(value, dict) else {}).get(f.id), definition=f, handle_undefined=handle_undefined)
+            out[f.id] = ensure_defined_structure(value=value.get(f.id), definition=f, handle_undefined=handle_undefined)
         return out
     elif definition.type == FieldDataType.LIST:
         if isinstance(value, list):
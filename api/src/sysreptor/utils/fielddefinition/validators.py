@@ -2,12 +2,15 @@ import functools
 import json
 from pathlib import Path
 
+import fastjsonschema
 import jsonschema
+import orjson
 import regex
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
 
+from sysreptor.utils.decorators import freeze_args, recursive_unfreeze
 from sysreptor.utils.fielddefinition.types import (
     BaseField,
     CweField,
@@ -18,10 +21,67 @@ from sysreptor.utils.fielddefinition.types import (
 )
 from sysreptor.utils.utils import is_json_string
 
+# Loaded and compiled once at import time instead of on the first validation in each worker process
+# Formats are not checked (regex patterns are validated with the regex module) and validation does not insert defaults
+validate_field_definition_schema = fastjsonschema.compile(
+    orjson.loads((Path(__file__).parent / 'fielddefinition.schema.json').read_bytes()),
+    use_formats=False,
+    use_default=False,
+)
+
+# Value schemas of field types that do not depend on the field definition
+_SIMPLE_FIELD_SCHEMAS = {
+    FieldDataType.STRING: {'type': ['string', 'null']},
+    FieldDataType.MARKDOWN: {'type': ['string', 'null']},
+    FieldDataType.CVSS: {'type': ['string', 'null']},
+    FieldDataType.COMBOBOX: {'type': ['string', 'null']},
+    FieldDataType.JSON: {'type': ['string', 'null']},
+    FieldDataType.DATE: {'type': ['string', 'null'], 'format': 'date'},
+    FieldDataType.NUMBER: {'type': ['number', 'null']},
+    FieldDataType.BOOLEAN: {'type': ['boolean', 'null']},
+    FieldDataType.USER: {'type': ['string', 'null'], 'format': 'uuid'},
+}
+
 
 @functools.cache
-def get_field_definition_schema():
-    return jsonschema.Draft202012Validator(schema=json.loads((Path(__file__).parent / 'fielddefinition.schema.json').read_text()))
+def _cwe_enum_values() -> tuple:
+    # Tuple: immutable and not copied by freeze_args
+    return tuple(sorted(CweField.cwe_ids())) + (None,)
+
+
+@functools.lru_cache(maxsize=4096)
+def _enum_values(choices: tuple[str, ...]) -> tuple:
+    # Canonicalized and shared between field definitions with the same choices
+    return tuple(sorted(choices)) + (None,)
+
+
+@freeze_args
+@functools.lru_cache(maxsize=512)
+def compile_field_values_schema(schema: dict):
+    """
+    Generate a specialized validation function for the schema.
+    Compiled validators are cached, because field definitions rarely change, but are validated often.
+    Formats are only annotations and not validated (same as jsonschema without format_checker).
+    """
+    return fastjsonschema.compile(recursive_unfreeze(schema), use_formats=False, use_default=False)
+
+
+def compile_json_schema(schema: dict) -> jsonschema.protocols.Validator:
+    """
+    Check the schema and create a validator for it.
+    Same as jsonschema.validate(), but the schema is only checked once instead of on every validation.
+    """
+    # Cache key is the serialized schema: frozen dicts compare True == 1 and would share validators of {"const": true} and {"const": 1}.
+    # Keys are not sorted to keep the schema as is in error messages.
+    return _compile_json_schema(json.dumps(schema))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_json_schema(schema_json: str) -> jsonschema.protocols.Validator:
+    schema = json.loads(schema_json)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 @deconstructible
@@ -36,20 +96,43 @@ class FieldDefinitionValidator:
         The definition `ref` has to be included in `val`.
         `val` may extend the nested structure by adding fields, but may not remove any fields.
         """
-        if val.type != ref.type:
-            return False
-        if val.type == FieldDataType.OBJECT:
-            if set(ref.fields_dict.keys()).difference(val.fields_dict.keys()):
+        # Walk nested fields with an explicit stack instead of recursion
+        stack = [(val, ref)]
+        while stack:
+            v, r = stack.pop()
+            if v is r:
+                continue
+            if v.type != r.type:
                 return False
-            return all([self.definition_contains(val[f.id], f) for f in ref.fields])
-        elif val.type == FieldDataType.LIST:
-            return self.definition_contains(val.items, ref.items)
+            if v.type == FieldDataType.OBJECT:
+                v_fields = v.field_dict
+                if not r.field_dict.keys() <= v_fields.keys():
+                    return False
+                stack.extend((v_fields[f.id], f) for f in r.fields)
+            elif v.type == FieldDataType.LIST:
+                stack.append((v.items, r.items))
         return True
 
+    def validate_patterns(self, fields: list[BaseField]):
+        """
+        Check that regex patterns of string fields compile.
+        Invalid patterns are reported when the definition is saved instead of when values are validated.
+        """
+        for f in fields:
+            if f.type == FieldDataType.STRING and f.pattern:
+                try:
+                    regex.compile(f.pattern)
+                except regex.error as ex:
+                    raise ValidationError(f'Invalid regex pattern in field "{f.id}"') from ex
+            elif f.type == FieldDataType.OBJECT:
+                self.validate_patterns(f.fields)
+            elif f.type == FieldDataType.LIST:
+                self.validate_patterns([f.items])
+
     def __call__(self, value: list[dict]):
         try:
-            get_field_definition_schema().validate(value)
-        except jsonschema.ValidationError as ex:
+            validate_field_definition_schema(value)
+        except fastjsonschema.JsonSchemaException as ex:
             raise ValidationError('Invalid field definition') from ex
 
         try:
@@ -58,15 +141,19 @@ class FieldDefinitionValidator:
             raise ValidationError(f'Invalid field definition: {ex.args[0]}') from ex
         except Exception as ex:
             raise ValidationError('Invalid field definition') from ex
+
+        # validate regex patterns of string fields
+        self.validate_patterns(parsed_value.fields)
+
         # validate core fields:
         #   required
         #   structure cannot be changed
         #   labels and default values can be changed
         if self.core_fields:
             for f in self.core_fields.fields:
-                if f.id not in parsed_value:
+                if (pf := parsed_value.get(f.id)) is None:
                     raise ValidationError(f'Core field "{f.id}" is required')
-                elif not self.definition_contains(parsed_value[f.id], f):
+                elif not self.definition_contains(pf, f):
                     raise ValidationError(f'Cannot change structure of core field "{f.id}"')
 
         # validate predefined fields:
@@ -75,14 +162,14 @@ class FieldDefinitionValidator:
         #   labels and default values can be changed
         if self.predefined_fields:
             for f in self.predefined_fields.fields:
-                if f.id in parsed_value and not self.definition_contains(parsed_value[f.id], f):
+                if (pf := parsed_value.get(f.id)) is not None and not self.definition_contains(pf, f):
                     raise ValidationError(f'Cannot change structure of predefined field "{f.id}"')
 
 
 @deconstructible
 class FieldValuesValidator:
     def __init__(self, field_definitions: FieldDefinition, require_all_fields=True) -> None:
-        self.schema = self.compile_definition_to_schema(field_definitions=field_definitions, require_all_fields=require_all_fields)
+        self.schema_validator = self.compile_definition_to_schema(field_definitions=field_definitions, require_all_fields=require_all_fields)
 
     def compile_object(self, definition: FieldDefinition|ObjectField):
         return {
@@ -94,20 +181,12 @@ class FieldValuesValidator:
 
     def compile_field(self, definition: BaseField):
         field_type = definition.type
-        if field_type in [FieldDataType.STRING, FieldDataType.MARKDOWN, FieldDataType.CVSS, FieldDataType.COMBOBOX, FieldDataType.JSON]:
-            return {'type': ['string', 'null']}
-        elif field_type == FieldDataType.DATE:
-            return {'type': ['string', 'null'], 'format': 'date'}
-        elif field_type == FieldDataType.NUMBER:
-            return {'type': ['number', 'null']}
-        elif field_type == FieldDataType.BOOLEAN:
-            return {'type': ['boolean', 'null']}
+        if (schema := _SIMPLE_FIELD_SCHEMAS.get(field_type)) is not None:
+            return dict(schema)
         elif field_type == FieldDataType.ENUM:
-            return {'type': ['string', 'null'], 'enum': [c.value for c in definition.choices] + [None]}
+            return {'type': ['string', 'null'], 'enum': _enum_values(tuple(c.value for c in definition.choices))}
         elif field_type == FieldDataType.CWE:
-            return {'type': ['string', 'null'], 'enum': [f"CWE-{c['id']}" for c in CweField.cwe_definitions()] + [None]}
-        elif field_type == FieldDataType.USER:
-            return {'type': ['string', 'null'], 'format': 'uuid'}
+            return {'type': ['string', 'null'], 'enum': _cwe_enum_values()}
         elif field_type == FieldDataType.OBJECT:
             return self.compile_object(definition)
         elif field_type == FieldDataType.LIST:
@@ -123,12 +202,12 @@ class FieldValuesValidator:
         }
         if not require_all_fields:
             schema['required'] = []
-        return jsonschema.Draft202012Validator(schema=schema)
+        return compile_field_values_schema(schema)
 
     def __call__(self, value: dict):
         try:
-            self.schema.validate(value)
-        except jsonschema.ValidationError as ex:
+            self.schema_validator(value)
+        except fastjsonschema.JsonSchemaException as ex:
             raise ValidationError('Data does not match field definition') from ex
 
 
@@ -138,34 +217,47 @@ class JsonSchemaValidator:
         self.schema = schema
 
     def __call__(self, value: dict|str):
-        if not isinstance(value, dict):
-            try:
-                value = json.loads(value)
-            except (json.JSONDecodeError, TypeError) as ex:
-                raise ValidationError('Invalid data: Not a valid JSON object') from ex
+        if isinstance(value, dict):
+            self.validate_parsed(value)
+        else:
+            self.validate_raw(value)
 
+    def validate_raw(self, value: str):
+        # Not parsed with orjson: it converts integers exceeding 64 bit to float, which changes validation results
         try:
-            jsonschema.validate(value, self.schema)
-        except jsonschema.ValidationError as ex:
-            raise ValidationError(f'Invalid data: does not match JSON schema: {ex}') from ex
+            parsed = json.loads(value)
+        except (json.JSONDecodeError, TypeError) as ex:
+            raise ValidationError('Invalid data: Not a valid JSON object') from ex
+        self.validate_parsed(parsed)
+
+    def validate_parsed(self, value):
+        try:
+            error = jsonschema.exceptions.best_match(compile_json_schema(self.schema).iter_errors(value))
         except (jsonschema.SchemaError, Exception) as ex:
             raise ValidationError(f'Invalid JSON schema: {ex}') from ex
+        if error is not None:
+            raise ValidationError(f'Invalid data: does not match JSON schema: {error}') from error
 
 
 @deconstructible
 class RegexPatternValidator:
     def __init__(self, pattern: str):
         self.pattern = pattern
+        # Compile pattern once instead of on every validation
+        try:
+            self.compiled_pattern = regex.compile(pattern)
+        except regex.error:
+            self.compiled_pattern = None
 
     def __call__(self, data: str):
+        if self.compiled_pattern is None:
+            raise ValidationError('Invalid regex pattern')
         try:
-            res = regex.match(pattern=self.pattern, string=data, timeout=settings.REGEX_VALIDATION_TIMEOUT.total_seconds())
+            res = self.compiled_pattern.match(data, timeout=settings.REGEX_VALIDATION_TIMEOUT.total_seconds())
             if not res:
                 raise ValidationError(f'Invalid format: Value does not match pattern /{self.pattern}/')
         except TimeoutError as ex:
             raise ValidationError('Regex timeout') from ex
-        except regex.error as ex:
-            raise ValidationError('Invalid regex pattern') from ex
 
 
 @deconstructible
@@ -1,15 +1,17 @@
 import base64
+import functools
 import hashlib
-import json
 import logging
 from pathlib import Path
 from uuid import uuid4
 
+import orjson
 from asgiref.sync import sync_to_async
 from Cryptodome.Hash import SHA512
 from Cryptodome.PublicKey import ECC
 from Cryptodome.Signature import eddsa
 from django.conf import settings
+from django.core.cache import cache as django_cache
 from django.db import models
 from django.utils import dateparse, timezone
 from rest_framework import permissions
@@ -18,10 +20,11 @@ from sysreptor.utils.configuration import configuration
 from sysreptor.utils.decorators import cache
 
 LICENSE_VALIDATION_KEYS = [
-    {'id': 'amber', 'algorithm': 'ed25519', 'key': 'MCowBQYDK2VwAyEAkqCS3lZbrzh+2mKTYymqPHtKBrh8glFxnj9OcoQR9xQ='},
-    {'id': 'silver', 'algorithm': 'ed25519', 'key': 'MCowBQYDK2VwAyEAwu/cl0CZSSBFOzFSz/hhUQQjHIKiT4RS3ekPevSKn7w='},
-    {'id': 'magenta', 'algorithm': 'ed25519', 'key': 'MCowBQYDK2VwAyEAd10mgfTx0fuPO6KwcYU98RLhreCF+BQCeI6CAs0YztA='},
+    {'id': 'amber', 'algorithm': 'ed25519', 'key': 'kqCS3lZbrzh+2mKTYymqPHtKBrh8glFxnj9OcoQR9xQ='},
+    {'id': 'silver', 'algorithm': 'ed25519', 'key': 'wu/cl0CZSSBFOzFSz/hhUQQjHIKiT4RS3ekPevSKn7w='},
+    {'id': 'magenta', 'algorithm': 'ed25519', 'key': 'd10mgfTx0fuPO6KwcYU98RLhreCF+BQCeI6CAs0YztA='},
 ]
+LICENSE_INFO_CACHE_KEY = 'license.license_info'
 
 
 class LicenseError(Exception):
@@ -46,7 +49,18 @@ class ProfessionalLicenseRequired(permissions.BasePermission):
         return True
 
 
-def verify_signature(data: str, signature: dict):
+@functools.cache
+def load_public_key(key: str):
+    key_bytes = base64.b64decode(key)
+    if len(key_bytes) == 32:
+        # Raw Ed25519 public key
+        return eddsa.import_public_key(key_bytes)
+    else:
+        # DER-encoded public key (legacy format)
+        return ECC.import_key(key_bytes)
+
+
+def verify_signature(data_hash: SHA512.SHA512Hash, signature: dict):
     public_key = next(filter(lambda k: k['id'] == signature['key_id'], LICENSE_VALIDATION_KEYS), None)
     if not public_key:
         return False
@@ -54,13 +68,22 @@ def verify_signature(data: str, signature: dict):
         return False
 
     try:
-        verifier = eddsa.new(key=ECC.import_key(base64.b64decode(public_key['key'])), mode='rfc8032')
-        verifier.verify(msg_or_hash=SHA512.new(data.encode()), signature=base64.b64decode(signature['signature']))
+        verifier = eddsa.new(key=load_public_key(public_key['key']), mode='rfc8032')
+        verifier.verify(msg_or_hash=data_hash, signature=base64.b64decode(signature['signature']))
         return True
     except Exception:
         return False
 
 
+def verify_signatures(data: str, signatures: list[dict]):
+    """
+    Check if at least one signature of the license data is valid.
+    The license data is hashed only once and shared by all signature checks.
+    """
+    data_hash = SHA512.new(data.encode())
+    return any(verify_signature(data_hash, s) for s in signatures)
+
+
 def parse_date(s):
     out = dateparse.parse_date(s)
     if out is None:
@@ -70,17 +93,16 @@ def parse_date(s):
 
 def decode_license(license):
     try:
-        license_wrapper = json.loads(base64.b64decode(license))
-        for signature in license_wrapper['signatures']:
-            if verify_signature(license_wrapper['data'], signature):
-                license_data = json.loads(license_wrapper['data'])
-                license_data['valid_from'] = parse_date(license_data['valid_from'])
-                license_data['valid_until'] = parse_date(license_data['valid_until'])
-                if not isinstance(license_data['users'], int) or license_data['users'] <= 0:
-                    raise LicenseError(license_data | {'error': 'Invalid user count in license'})
-                return license_data
-        else:
+        license_wrapper = orjson.loads(base64.b64decode(license))
+        if not verify_signatures(license_wrapper['data'], license_wrapper['signatures']):
             raise LicenseError('No valid signature found for license')
+
+        license_data = orjson.loads(license_wrapper['data'])
+        license_data['valid_from'] = parse_date(license_data['valid_from'])
+        license_data['valid_until'] = parse_date(license_data['valid_until'])
+        if not isinstance(license_data['users'], int) or license_data['users'] <= 0:
+            raise LicenseError(license_data | {'error': 'Invalid user count in license'})
+        return license_data
     except LicenseError:
         raise
     except Exception as ex:
@@ -136,11 +158,15 @@ def get_license_hash():
         return None
 
 
-@cache('license.license_info', timeout=10 * 60)
+@cache(LICENSE_INFO_CACHE_KEY, timeout=10 * 60)
 def check_license(**kwargs):
     return decode_and_validate_license(license=settings.LICENSE, **kwargs)
 
 
+def clear_license_cache():
+    django_cache.delete(LICENSE_INFO_CACHE_KEY)
+
+
 async def acheck_license(**kwargs):
     return await sync_to_async(check_license)(**kwargs)
 
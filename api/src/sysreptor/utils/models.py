@@ -55,17 +55,28 @@ class ModelDiffMixin(models.Model):
     def clear_changed_fields(self):
         self.__initial = self._dict
 
+    @classmethod
+    @functools.cache
+    def _diff_fields(cls) -> tuple[str, ...]:
+        """
+        Attribute names of fields tracked for diffs. Computed once per model class.
+        """
+        diff_fields = {field.attname for field in cls._meta.fields if not isinstance(field, GenericRelation)}
+        return tuple(f.attname for f in itertools.chain(cls._meta.concrete_fields, cls._meta.private_fields, cls._meta.many_to_many) if getattr(f, 'attname', None) in diff_fields)
+
     @property
     def _dict(self):
-        diff_fields = {field.attname for field in self._meta.fields if not isinstance(field, GenericRelation)} - self.get_deferred_fields()
+        # Read field values directly from the instance dict instead of via field descriptors.
+        # Deferred fields are not loaded and therefore not present in the instance dict.
+        values = self.__dict__
 
         out = {}
-        for f in itertools.chain(self._meta.concrete_fields, self._meta.private_fields, self._meta.many_to_many):
-            if getattr(f, 'attname', None) in diff_fields:
-                v = f.value_from_object(self)
+        for attname in self._diff_fields():
+            if attname in values:
+                v = values[attname]
                 if isinstance(v, dict|list):
                     v = v.copy()
-                out[f.attname] = v
+                out[attname] = v
         return out
 
 
@@ -106,5 +117,10 @@ def disable_for_loaddata(signal_handler):
 
 class SubqueryCount(models.Subquery):
     template = "(SELECT count(*) FROM (%(subquery)s) _count)"
-    output_field = models.PositiveIntegerField()
+    output_field = models.BigIntegerField()
+
+    def __init__(self, queryset, output_field=None, **extra):
+        super().__init__(queryset, output_field=output_field, **extra)
+        # Ordering does not affect the count. Do not sort rows by the model's default ordering.
+        self.query.clear_ordering(force=False)
 
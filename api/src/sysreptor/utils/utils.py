@@ -8,6 +8,7 @@ from datetime import date, datetime
 from itertools import groupby
 from typing import Any
 
+import orjson
 from asgiref.sync import async_to_sync, sync_to_async
 from django.db import close_old_connections, connections
 from django.utils import dateparse, timezone
@@ -56,30 +57,22 @@ def set_key_or_attr(d: dict|object, k: str, value: Any):
 
 
 def copy_keys(d: dict|object, keys: Iterable[str]) -> dict:
-    keys = set(keys)
-    out = {}
-    for k in keys:
-        if isinstance(d, dict|OrderedDict):
-            if k in d:
-                out[k] = d[k]
-        else:
-            if hasattr(d, k):
-                out[k] = getattr(d, k)
-    return out
+    if isinstance(d, dict|OrderedDict):
+        return {k: d[k] for k in set(keys) if k in d}
+    else:
+        return {k: getattr(d, k) for k in set(keys) if hasattr(d, k)}
 
 
 def omit_keys(d: dict, keys: Iterable[str]) -> dict:
     out = dict(d)
     for k in set(keys):
-        k_parts = k.split('.') if isinstance(k, str) else [k]
-        if k_parts[0] in out:
-            if len(k_parts) == 1:
-                out.pop(k_parts[0], None)
-            else:
-                sub_dict = out.get(k_parts[0], {})
-                if isinstance(sub_dict, dict):
-                    sub_out = omit_keys(sub_dict, ['.'.join(k_parts[1:])])
-                    out[k_parts[0]] = sub_out
+        if isinstance(k, str) and '.' in k:
+            k_first, k_rest = k.split('.', 1)
+            sub_dict = out.get(k_first)
+            if isinstance(sub_dict, dict):
+                out[k_first] = omit_keys(sub_dict, [k_rest])
+        else:
+            out.pop(k, None)
     return out
 
 
@@ -104,6 +97,13 @@ def is_uuid(val) -> bool:
 
 
 def is_json_string(val: str) -> bool:
+    try:
+        orjson.loads(val)
+        return True
+    except (TypeError, orjson.JSONDecodeError):
+        pass
+
+    # Fallback for values accepted by json, but rejected by orjson (e.g. NaN)
     try:
         json.loads(val)
         return True
@@ -149,10 +149,11 @@ def merge(*args):
     for d in args:
         if isinstance(d, dict|OrderedDict) and isinstance(out, dict|OrderedDict):
             for k, v in d.items():
-                if k not in out:
-                    out[k] = v
+                # Only nested dicts and lists need to be merged recursively, other values are overwritten
+                if k in out and isinstance(v, dict|list):
+                    out[k] = merge(out[k], v)
                 else:
-                    out[k] = merge(out.get(k), v)
+                    out[k] = v
         elif isinstance(d, list) and isinstance(out, list):
             l = []
             for i, dv in enumerate(d):